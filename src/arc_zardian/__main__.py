@@ -0,0 +1,24 @@
+"""Entry point for ``python -m arc_zardian`` and the ``arc-zardian`` script.
+
+``--version`` is answered here, before :mod:`arc_zardian.cli` (and with it
+Typer, Click and Rich) is imported.
+"""
+
+import sys
+
+from arc_zardian import __version__
+
+
+def main() -> None:
+    """Run the Arc ZARDIAN command line interface."""
+    if len(sys.argv) >= 2 and sys.argv[1] in ("-v", "--version"):
+        print(f"Arc ZARDIAN v{__version__}")
+        sys.exit(0)
+
+    from arc_zardian.cli import app
+
+    app()
+
+
+if __name__ == "__main__":
+    main()
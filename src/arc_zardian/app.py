@@ -1,21 +1,16 @@
 import streamlit as st
 from typing import Dict
 import asyncio
+import logging
+import threading
 
 from arc_zardian.core.optimizer import ConversionOptimizer, Exchange
-from arc_zardian.core.models import ConversionPath, ConversionResult
-
-# Set page config
-st.set_page_config(
-    page_title="Arc ZARDIAN - Optimal ZAR to USDC Converter",
-    page_icon="💱",
-    layout="wide"
-)
+from arc_zardian.core.models import EXCHANGE_NAMES, ConversionPath, ConversionResult
 
 # Custom CSS for better styling
-st.markdown("""
+_CSS = """
 <style>
-    .stButton>button {
+    .stButton>button, .stFormSubmitButton>button {
         background-color: #4CAF50;
         color: white;
         font-weight: bold;
@@ -23,7 +18,7 @@ st.markdown("""
         border-radius: 4px;
         border: none;
     }
-    .stButton>button:hover {
+    .stButton>button:hover, .stFormSubmitButton>button:hover {
         background-color: #45a049;
     }
     .metric-box {
@@ -36,89 +31,148 @@ st.markdown("""
         border: 2px solid #4CAF50;
     }
 </style>
-""", unsafe_allow_html=True)
-
-# App title and description
-st.title("💱 Arc ZARDIAN")
-st.markdown("### Find the best exchange rate for converting ZAR to USDC")
-st.markdown("Compare rates across multiple exchanges to get the most USDC for your ZAR.")
-
-# Input section
-st.markdown("---")
-col1, col2 = st.columns([2, 1])
-with col1:
-    zar_amount = st.number_input(
-        "Enter ZAR Amount",
-        min_value=0.01,
-        value=1000.0,
-        step=100.0,
-        format="%.2f"
+"""
+
+
+@st.cache_resource
+def get_optimizer() -> ConversionOptimizer:
+    """Return the optimizer shared by every rerun and session."""
+    return ConversionOptimizer()
+
+
+@st.cache_resource
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """Return a long-lived event loop running in a background thread.
+
+    Reusing one loop across clicks lets connection pools bound to it
+    survive between conversions instead of being torn down by asyncio.run.
+    """
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    return loop
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def find_best_conversion(zar_amount: float) -> ConversionResult:
+    """Find the best conversion path, reusing recent results across reruns.
+
+    Streamlit reruns the whole script on every interaction, so identical
+    requests within the TTL are served from the cache instead of querying
+    every exchange again.
+    """
+    future = asyncio.run_coroutine_threadsafe(
+        get_optimizer().find_best_path(zar_amount), get_event_loop()
     )
+    return future.result()
 
-# Convert button
-if st.button("🚀 Find Best Conversion"):
-    if zar_amount <= 0:
-        st.error("Please enter a positive amount")
-    else:
-        with st.spinner("Finding the best conversion path..."):
-            try:
-                # Create optimizer and find best path
-                optimizer = ConversionOptimizer()
-                result = asyncio.run(optimizer.find_best_path(zar_amount))
-                
-                # Display results
-                st.markdown("---")
-                st.markdown("## 🎯 Best Conversion Option")
-                
-                # Best option metrics
-                best = result.optimal_path
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    st.metric("Exchange", best.exchange.value)
-                with col2:
-                    st.metric("USDC Received", f"{best.usdc_received:,.2f}")
-                with col3:
-                    st.metric("Rate", f"R{best.rate:,.4f}/USDC")
-                
-                # Details in an expander
-                with st.expander("📊 View Detailed Breakdown", expanded=True):
-                    st.markdown("### Transaction Details")
-                    st.write(f"- **ZAR Amount:** R{zar_amount:,.2f}")
-                    st.write(f"- **Exchange Fee:** R{best.fee:,.2f}")
-                    st.write(f"- **Effective Rate:** R{best.rate:,.4f} per USDC")
-                    
-                    # Show alternative options if available
-                    if result.alternative_paths:
-                        st.markdown("### Alternative Options")
-                        alt_data = []
-                        for path in result.alternative_paths:
-                            alt_data.append({
-                                "Exchange": path.exchange.value,
-                                "USDC Received": f"{path.usdc_received:,.2f}",
-                                "Rate (R/USDC)": f"{path.rate:,.4f}",
-                                "Fee (ZAR)": f"{path.fee:,.2f}"
-                            })
-                        
-                        if alt_data:
-                            st.table(alt_data)
-                
-                # Disclaimer
-                st.markdown("---")
-                st.info(
-                    "💡 *Rates and fees are subject to change. "
-                    "Actual conversion may vary based on market conditions and exchange policies.*"
-                )
-                
-            except Exception as e:
-                st.error(f"An error occurred while processing your request: {str(e)}")
-                st.error("Please try again later or check your internet connection.")
+
+def main() -> None:
+    """Render the converter page."""
+    # Configure logging for the app; a no-op on reruns once handlers exist
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+
+    # Set page config
+    st.set_page_config(
+        page_title="Arc ZARDIAN - Optimal ZAR to USDC Converter",
+        page_icon="💱",
+        layout="wide"
+    )
+
+    # Apply custom styling
+    st.markdown(_CSS, unsafe_allow_html=True)
+
+    # App title and description
+    st.title("💱 Arc ZARDIAN")
+    st.markdown("### Find the best exchange rate for converting ZAR to USDC")
+    st.markdown("Compare rates across multiple exchanges to get the most USDC for your ZAR.")
+
+    # Input section
+    st.markdown("---")
+    with st.form("convert_form"):
+        col1, col2 = st.columns([2, 1])
+        with col1:
+            zar_amount = st.number_input(
+                "Enter ZAR Amount",
+                min_value=0.01,
+                value=1000.0,
+                step=100.0,
+                format="%.2f"
+            )
+
+        # Convert button
+        submitted = st.form_submit_button("🚀 Find Best Conversion")
+
+    if submitted:
+        if zar_amount <= 0:
+            st.error("Please enter a positive amount")
+        else:
+            with st.spinner("Finding the best conversion path..."):
+                try:
+                    # Find best path (cached briefly across reruns)
+                    st.session_state["result"] = find_best_conversion(zar_amount)
+                except Exception as e:
+                    st.session_state.pop("result", None)
+                    st.error(f"An error occurred while processing your request: {str(e)}")
+                    st.error("Please try again later or check your internet connection.")
                 
-                # Log the error for debugging
-                st.exception("Error details:")
-
-# Add some spacing at the bottom
-st.markdown("---")
-st.markdown(
-    "*Built with ❤️ for efficient crypto conversions. "
-    "[Report issues](https://github.com/yourusername/arc-zardian/issues)*"
-)
+                    # Log the error for debugging
+                    st.exception("Error details:")
+
+    # Display the latest result; it survives reruns triggered by other widgets
+    result = st.session_state.get("result")
+    if result is not None:
+        st.markdown("---")
+        st.markdown("## 🎯 Best Conversion Option")
+    
+        # Best option metrics
+        best = result.optimal_path
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Exchange", EXCHANGE_NAMES[best.exchange])
+        with col2:
+            st.metric("USDC Received", f"{best.usdc_received:,.2f}")
+        with col3:
+            st.metric("Rate", f"R{best.rate:,.4f}/USDC")
+    
+        # Details in an expander
+        with st.expander("📊 View Detailed Breakdown", expanded=True):
+            st.markdown("### Transaction Details")
+            st.write(f"- **ZAR Amount:** R{best.zar_amount:,.2f}")
+            st.write(f"- **Exchange Fee:** R{best.fee:,.2f}")
+            st.write(f"- **Effective Rate:** R{best.rate:,.4f} per USDC")
+        
+            # Show alternative options if available
+            if result.alternative_paths:
+                st.markdown("### Alternative Options")
+                alt_data = []
+                for path in result.alternative_paths:
+                    alt_data.append({
+                        "Exchange": EXCHANGE_NAMES[path.exchange],
+                        "USDC Received": f"{path.usdc_received:,.2f}",
+                        "Rate (R/USDC)": f"{path.rate:,.4f}",
+                        "Fee (ZAR)": f"{path.fee:,.2f}"
+                    })
+            
+                if alt_data:
+                    st.table(alt_data)
+    
+        # Disclaimer
+        st.markdown("---")
+        st.info(
+            "💡 *Rates and fees are subject to change. "
+            "Actual conversion may vary based on market conditions and exchange policies.*"
+        )
+
+    # Add some spacing at the bottom
+    st.markdown("---")
+    st.markdown(
+        "*Built with ❤️ for efficient crypto conversions. "
+        "[Report issues](https://github.com/yourusername/arc-zardian/issues)*"
+    )
+
+
+if __name__ == "__main__":
+    main()
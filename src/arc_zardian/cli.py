@@ -3,22 +3,20 @@
 This module provides the main entry point for the Arc ZARDIAN application.
 """
 
+import asyncio
+import gc
 import logging
-from typing import Optional
+from typing import Any, Dict, Optional
 
 import typer
 
 from arc_zardian import __version__
 from arc_zardian.config import get_settings
+from arc_zardian.exchanges import get_exchange, get_exchange_class
 
 # Initialize Typer app
 app = typer.Typer(name="arc-zardian", help="ZAR to USDC Arbitrage and Trading System")
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
 logger = logging.getLogger(__name__)
 
 
@@ -49,8 +47,15 @@ def main(
     This tool helps you find and execute arbitrage opportunities between ZAR and USDC
     across multiple exchanges.
     """
-    # This is a callback function that doesn't need to do anything
-    # as it's just used to provide the main command structure.
+    # Configure logging only when the CLI actually runs a command
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    
+    # Settings live for the whole run; freeze them out of GC scans
+    get_settings()
+    gc.freeze()
 
 
 @app.command()
@@ -71,9 +76,6 @@ def find_opportunities(
         min_profit: Minimum profit percentage to consider (default: from config).
         verbose: Enable verbose output.
     """
-    from ccxt import binance, luno
-    from arc_zardian.config import get_settings
-    
     settings = get_settings()
     
     if verbose:
@@ -85,17 +87,13 @@ def find_opportunities(
     
     try:
         # Initialize exchanges
-        binance_exchange = binance({
-            'apiKey': settings.BINANCE_API_KEY,
-            'secret': settings.BINANCE_API_SECRET,
-            'enableRateLimit': True
-        })
-        
-        luno_exchange = luno({
-            'apiKey': settings.LUNO_API_KEY,
-            'secret': settings.LUNO_API_SECRET,
-            'enableRateLimit': True
-        })
+        binance_exchange = get_exchange(
+            "binance", settings.BINANCE_API_KEY, settings.BINANCE_API_SECRET
+        )
+        luno_exchange = get_exchange(
+            "luno", settings.LUNO_API_KEY, settings.LUNO_API_SECRET
+        )
+        gc.freeze()
         
         # Get ticker prices
         binance_ticker = binance_exchange.fetch_ticker('USDC/ZAR')
@@ -111,18 +109,20 @@ def find_opportunities(
         
         if opportunity >= min_profit:
             logger.info("🚀 Arbitrage opportunity found!")
-            logger.info(f"  - Binance USDC/ZAR: {binance_price:.2f}")
-            logger.info(f"  - LUNO XBT/ZAR: {luno_price:.2f}")
-            logger.info(f"  - Opportunity: {opportunity:.2f}%")
+            logger.info("  - Binance USDC/ZAR: %.2f", binance_price)
+            logger.info("  - LUNO XBT/ZAR: %.2f", luno_price)
+            logger.info("  - Opportunity: %.2f%%", opportunity)
         else:
             logger.info("🔍 No significant arbitrage opportunities found.")
             if verbose:
-                logger.info(f"  - Binance USDC/ZAR: {binance_price:.2f}")
-                logger.info(f"  - LUNO XBT/ZAR: {luno_price:.2f}")
-                logger.info(f"  - Current spread: {opportunity:.2f}% (min required: {min_profit}%)")
+                logger.info("  - Binance USDC/ZAR: %.2f", binance_price)
+                logger.info("  - LUNO XBT/ZAR: %.2f", luno_price)
+                logger.info(
+                    "  - Current spread: %.2f%% (min required: %s%%)", opportunity, min_profit
+                )
                 
     except Exception as e:
-        logger.error(f"❌ Error finding opportunities: {str(e)}")
+        logger.error("❌ Error finding opportunities: %s", e)
         if verbose:
             import traceback
             logger.debug(traceback.format_exc())
@@ -131,58 +131,85 @@ def find_opportunities(
 @app.command()
 def check_status() -> None:
     """Check the status of exchanges and account balances."""
-    from ccxt import binance, luno, bybit
-    from arc_zardian.config import get_settings
-    
+    asyncio.run(_check_status())
+
+
+async def _fetch_balance(name: str, api_key: str, secret: str) -> Dict[str, Any]:
+    """Fetch account balances from an exchange using ccxt's async client.
+
+    Args:
+        name: ccxt exchange id, e.g. ``"binance"``.
+        api_key: API key for the exchange.
+        secret: API secret for the exchange.
+
+    Returns:
+        Dict[str, Any]: The balance structure returned by ccxt.
+    """
+    # Async clients own an aiohttp session bound to the running loop, so
+    # they are created per run and closed rather than cached
+    exchange = get_exchange_class(name, asynchronous=True)({
+        'apiKey': api_key,
+        'secret': secret,
+        'enableRateLimit': True
+    })
+    try:
+        balance: Dict[str, Any] = await exchange.fetch_balance()
+        return balance
+    finally:
+        await exchange.close()
+
+
+async def _check_status() -> None:
+    """Query all configured exchanges concurrently and report their balances."""
     settings = get_settings()
+    bybit_configured = bool(settings.BYBIT_API_KEY and settings.BYBIT_API_SECRET)
+    
+    checks = [
+        _fetch_balance("binance", settings.BINANCE_API_KEY, settings.BINANCE_API_SECRET),
+        _fetch_balance("luno", settings.LUNO_API_KEY, settings.LUNO_API_SECRET),
+    ]
+    if bybit_configured:
+        checks.append(
+            _fetch_balance("bybit", settings.BYBIT_API_KEY, settings.BYBIT_API_SECRET)
+        )
+    
+    # The balance requests are independent, so wait on them together.
+    # Failures come back as exceptions, including CancelledError, which is
+    # only a BaseException
+    binance_balance, luno_balance, *rest = await asyncio.gather(
+        *checks, return_exceptions=True
+    )
     
     # Check Binance connection
-    try:
-        binance_exchange = binance({
-            'apiKey': settings.BINANCE_API_KEY,
-            'secret': settings.BINANCE_API_SECRET,
-            'enableRateLimit': True
-        })
-        binance_balance = binance_exchange.fetch_balance()
+    if isinstance(binance_balance, BaseException):
+        logger.error("❌ Binance connection failed: %s", binance_balance)
+    else:
         logger.info("✅ Binance connection successful")
-        logger.info(f"  - Available ZAR: {binance_balance.get('ZAR', {}).get('free', 0):.2f}")
-        logger.info(f"  - Available USDC: {binance_balance.get('USDC', {}).get('free', 0):.4f}")
-    except Exception as e:
-        logger.error(f"❌ Binance connection failed: {str(e)}")
+        logger.info("  - Available ZAR: %.2f", binance_balance.get('ZAR', {}).get('free', 0))
+        logger.info("  - Available USDC: %.4f", binance_balance.get('USDC', {}).get('free', 0))
     
     # Check LUNO connection
-    try:
-        luno_exchange = luno({
-            'apiKey': settings.LUNO_API_KEY,
-            'secret': settings.LUNO_API_SECRET,
-            'enableRateLimit': True
-        })
-        luno_balance = luno_exchange.fetch_balance()
-        logger.info("✅ LUNO connection successful")
-        logger.info(f"  - Available ZAR: {luno_balance.get('ZAR', {}).get('free', 0):.2f}")
-        logger.info(f"  - Available XBT: {luno_balance.get('XBT', {}).get('free', 0):.8f}")
-    except Exception as e:
-        logger.error(f"❌ LUNO connection failed: {str(e)}")
+    if isinstance(luno_balance, BaseException):
+        logger.error("❌ LUNO connection failed: %s", luno_balance)
         logger.info("ℹ️  Make sure you've set LUNO_API_KEY and LUNO_API_SECRET in your .env file")
+    else:
+        logger.info("✅ LUNO connection successful")
+        logger.info("  - Available ZAR: %.2f", luno_balance.get('ZAR', {}).get('free', 0))
+        logger.info("  - Available XBT: %.8f", luno_balance.get('XBT', {}).get('free', 0))
     
     # Check Bybit connection
-    try:
-        if not settings.BYBIT_API_KEY or not settings.BYBIT_API_SECRET:
-            logger.warning("⚠️  Bybit API key or secret not found in .env file")
-            return
-            
-        bybit_exchange = bybit({
-            'apiKey': settings.BYBIT_API_KEY,
-            'secret': settings.BYBIT_API_SECRET,
-            'enableRateLimit': True
-        })
-        bybit_balance = bybit_exchange.fetch_balance()
-        logger.info("✅ Bybit connection successful")
-        logger.info(f"  - Available USDT: {bybit_balance.get('USDT', {}).get('free', 0):.2f}")
-        logger.info(f"  - Available BTC: {bybit_balance.get('BTC', {}).get('free', 0):.8f}")
-    except Exception as e:
-        logger.error(f"❌ Bybit connection failed: {str(e)}")
+    if not bybit_configured:
+        logger.warning("⚠️  Bybit API key or secret not found in .env file")
+        return
+    
+    bybit_balance = rest[0]
+    if isinstance(bybit_balance, BaseException):
+        logger.error("❌ Bybit connection failed: %s", bybit_balance)
         logger.info("ℹ️  Make sure you've set BYBIT_API_KEY and BYBIT_API_SECRET in your .env file")
+    else:
+        logger.info("✅ Bybit connection successful")
+        logger.info("  - Available USDT: %.2f", bybit_balance.get('USDT', {}).get('free', 0))
+        logger.info("  - Available BTC: %.8f", bybit_balance.get('BTC', {}).get('free', 0))
 
 
 if __name__ == "__main__":
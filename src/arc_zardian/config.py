@@ -4,23 +4,74 @@ This module handles loading and validating configuration from environment variab
 """
 
 import os
-import sys
-from typing import Optional
+import re
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from typing import Any, Callable, Dict, Tuple, get_type_hints
 
-from pydantic import Field, field_validator
-from pydantic_settings import BaseSettings, SettingsConfigDict
+# Unquoted values may carry a trailing comment, e.g. ``KEY=value  # note``.
+# Only a ``#`` preceded by whitespace starts one, so ``KEY=  # note`` is blank
+# while ``KEY=#secret`` keeps its value
+_INLINE_COMMENT = re.compile(r"\s+#.*$")
 
 
-class Settings(BaseSettings):
+def _parse_dotenv(path: str) -> Dict[str, str]:
+    """Parse ``KEY=VALUE`` lines from a dotenv file.
+
+    Blank lines and comments are skipped, an ``export`` prefix is ignored,
+    quoted values are taken up to their closing quote and unquoted values lose
+    any trailing comment. Escape sequences such as ``\\n`` are not expanded,
+    even in double-quoted values. A missing file yields no values.
+    Parsed files are cached until their modification time or size changes.
+
+    Args:
+        path: Path to the dotenv file.
+
+    Returns:
+        Dict[str, str]: The variables defined in the file. Callers must not
+        mutate it, as it is shared through the cache.
+    """
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return {}
+    return _read_dotenv(path, stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=8)
+def _read_dotenv(path: str, mtime_ns: int, size: int) -> Dict[str, str]:
+    """Read and parse ``path``; ``mtime_ns`` and ``size`` only key the cache."""
+    values: Dict[str, str] = {}
+    try:
+        with open(path, encoding="utf-8") as f:
+            lines = f.read().splitlines()
+    except FileNotFoundError:
+        return values
+
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if line.startswith("export "):
+            line = line[len("export "):]
+        key, sep, value = line.partition("=")
+        if not sep:
+            continue
+        raw, value = value, value.strip()
+        # A quoted value ends at its closing quote; anything after it, such
+        # as a trailing comment, is dropped
+        end = value.find(value[0], 1) if value[:1] in ("'", '"') else -1
+        if end != -1:
+            value = value[1:end]
+        else:
+            value = _INLINE_COMMENT.sub("", raw).strip()
+        values[key.strip()] = value
+    return values
+
+
+@dataclass(frozen=True)
+class Settings:
     """Application settings loaded from environment variables."""
-    
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        case_sensitive=True,
-        env_prefix="",
-        extra="ignore"
-    )
 
     # Environment
     ENVIRONMENT: str = "development"
@@ -42,37 +93,84 @@ class Settings(BaseSettings):
     # Rate Limiting (requests per minute)
     RATE_LIMIT: int = 60
 
-    @field_validator("MIN_PROFIT_PERCENTAGE")
-    @classmethod
-    def validate_min_profit(cls, v: float) -> float:
+    def __post_init__(self) -> None:
         """Validate that minimum profit percentage is non-negative."""
-        if v < 0:
+        if self.MIN_PROFIT_PERCENTAGE < 0:
             raise ValueError("MIN_PROFIT_PERCENTAGE must be non-negative")
-        return v
 
+    @classmethod
+    def from_env(cls, env_file: str = ".env") -> "Settings":
+        """Load settings from ``env_file`` and the process environment.
+
+        Environment variables take precedence over values from ``env_file``.
+        Unknown variables are ignored.
+
+        Args:
+            env_file: Path to an optional dotenv file.
+
+        Returns:
+            Settings: The loaded settings.
 
-# Global settings instance
-settings: Optional[Settings] = None
+        Raises:
+            ValueError: If a value cannot be converted to its setting's type.
+        """
+        values: Dict[str, Any] = {}
+        for key, value in _load_env(env_file).items():
+            try:
+                values[key] = _FIELD_TYPES[key](value)
+            except ValueError as exc:
+                raise ValueError(f"{key}: {exc}") from exc
+        return cls(**values)
 
 
+# Settings keys and their types, resolved once instead of on every load.
+# get_type_hints evaluates the annotations, so this keeps working if they
+# are ever postponed to strings
+_FIELD_HINTS = get_type_hints(Settings)
+_FIELD_TYPES: Dict[str, Callable[[str], Any]] = {
+    f.name: _FIELD_HINTS[f.name] for f in fields(Settings)
+}
+_ENV_KEYS: Tuple[str, ...] = tuple(_FIELD_TYPES)
+
+
+def _load_env(env_file: str) -> Dict[str, str]:
+    """Collect raw values for the known settings keys.
+
+    Only the keys in ``_ENV_KEYS`` are looked up, with ``os.environ`` taking
+    precedence over ``env_file``.
+
+    Args:
+        env_file: Path to an optional dotenv file.
+
+    Returns:
+        Dict[str, str]: Raw string values keyed by setting name.
+    """
+    dotenv = _parse_dotenv(env_file)
+    environ = os.environ
+    values: Dict[str, str] = {}
+    for key in _ENV_KEYS:
+        if key in environ:
+            values[key] = environ[key]
+        elif key in dotenv:
+            values[key] = dotenv[key]
+    return values
+
+
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """Get the global settings instance.
 
+    Settings are loaded on the first call and reused afterwards. Call
+    ``get_settings.cache_clear()`` to force a reload.
+
     Returns:
         Settings: The global settings instance.
     """
-    global settings
-    if settings is None:
-        settings = Settings()
-    return settings
-
-
-def init_settings() -> None:
-    """Initialize the global settings."""
-    global settings
-    settings = Settings()
+    return Settings.from_env()
 
 
-# Only initialize settings if not in test environment
-if "pytest" not in sys.modules:
-    init_settings()
+def __getattr__(name: str) -> Any:
+    """Resolve ``settings`` lazily so importing this module stays cheap."""
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,16 +1,23 @@
+from __future__ import annotations
+
 from dataclasses import dataclass
-from typing import List, Optional
-from enum import Enum
+from enum import IntEnum
+
+
+class Exchange(IntEnum):
+    BINANCE = 0
+    LUNO = 1
+    BYBIT = 2
 
 
-class Exchange(Enum):
-    BINANCE = "Binance"
-    LUNO = "Luno"
-    BYBIT = "Bybit"
+# Display names, indexed by Exchange
+EXCHANGE_NAMES = ("Binance", "Luno", "Bybit")
 
 
 @dataclass
 class ConversionPath:
+    __slots__ = ("exchange", "zar_amount", "usdc_received", "fee", "rate")
+
     exchange: Exchange
     zar_amount: float
     usdc_received: float
@@ -20,8 +27,10 @@ class ConversionPath:
 
 @dataclass
 class ConversionResult:
+    __slots__ = ("optimal_path", "alternative_paths", "timestamp")
+
     optimal_path: ConversionPath
-    alternative_paths: List[ConversionPath]
+    alternative_paths: tuple[ConversionPath, ...]
     timestamp: float
 
     @property
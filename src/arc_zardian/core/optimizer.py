@@ -1,15 +1,16 @@
+from __future__ import annotations
+
 import asyncio
 import logging
-from typing import Dict, List, Optional
-from datetime import datetime, timezone
+import time
+from operator import attrgetter
+from typing import TYPE_CHECKING
+
+from .models import EXCHANGE_NAMES, Exchange, ConversionPath, ConversionResult
 
-from .models import Exchange, ConversionPath, ConversionResult
+if TYPE_CHECKING:
+    from typing import Dict, Optional
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
 class ExchangeClientBase:
@@ -20,8 +21,12 @@ class ExchangeClientBase:
         """Get the current ZAR/USDC rate from the exchange."""
         raise NotImplementedError
     
-    async def calculate_fee(self, zar_amount: float) -> float:
-        """Calculate the trading fee for the given ZAR amount."""
+    def calculate_fee(self, zar_amount: float) -> float:
+        """Calculate the trading fee for the given ZAR amount.
+
+        Fees are computed from local fee schedules, so this is a plain method
+        rather than a coroutine.
+        """
         raise NotImplementedError
 
 
@@ -33,7 +38,7 @@ class BinanceClient(ExchangeClientBase):
         # For now, return a mock rate
         return 18.5
     
-    async def calculate_fee(self, zar_amount: float) -> float:
+    def calculate_fee(self, zar_amount: float) -> float:
         # Binance charges 0.1% trading fee
         return zar_amount * 0.001
 
@@ -46,7 +51,7 @@ class LunoClient(ExchangeClientBase):
         # For now, return a mock rate
         return 18.7
     
-    async def calculate_fee(self, zar_amount: float) -> float:
+    def calculate_fee(self, zar_amount: float) -> float:
         # Luno charges 0.5% trading fee
         return zar_amount * 0.005
 
@@ -59,7 +64,7 @@ class BybitClient(ExchangeClientBase):
         # For now, return a mock rate
         return 18.6
     
-    async def calculate_fee(self, zar_amount: float) -> float:
+    def calculate_fee(self, zar_amount: float) -> float:
         # Bybit charges 0.1% trading fee for makers, 0.3% for takers
         # We'll use taker fee as worst-case scenario
         return zar_amount * 0.003
@@ -68,7 +73,7 @@ class BybitClient(ExchangeClientBase):
 class ConversionOptimizer:
     """Finds the best conversion path from ZAR to USDC across multiple exchanges."""
     
-    def __init__(self, clients: Dict[Exchange, ExchangeClientBase] = None):
+    def __init__(self, clients: Optional[Dict[Exchange, ExchangeClientBase]] = None):
         """Initialize the optimizer with exchange clients.
         
         Args:
@@ -95,19 +100,16 @@ class ConversionOptimizer:
         client = self.clients[exchange]
         
         try:
-            # Get rate and fee concurrently
-            rate, fee = await asyncio.gather(
-                client.get_zar_usdc_rate(),
-                client.calculate_fee(zar_amount)
-            )
+            # Only the rate needs I/O; the fee is plain arithmetic
+            rate = await client.get_zar_usdc_rate()
+            fee = client.calculate_fee(zar_amount)
             
             # Calculate final USDC amount after fee
             usdc_received = (zar_amount - fee) / rate
             
             self.logger.info(
-                f"{exchange.value}: Rate={rate:.4f}, "
-                f"Fee={fee:.2f} ZAR, "
-                f"USDC received={usdc_received:.2f}"
+                "%s: Rate=%.4f, Fee=%.2f ZAR, USDC received=%.2f",
+                EXCHANGE_NAMES[exchange], rate, fee, usdc_received
             )
             
             return ConversionPath(
@@ -119,7 +121,7 @@ class ConversionOptimizer:
             )
             
         except Exception as e:
-            self.logger.error(f"Error evaluating {exchange.value}: {str(e)}")
+            self.logger.error("Error evaluating %s: %s", EXCHANGE_NAMES[exchange], e)
             return None
     
     async def find_best_path(self, zar_amount: float) -> ConversionResult:
@@ -132,43 +134,57 @@ class ConversionOptimizer:
         Returns:
             ConversionResult containing the optimal path and alternatives
         """
-        self.logger.info(f"Finding best conversion path for {zar_amount:.2f} ZAR")
-        
-        # Evaluate all exchanges concurrently
-        tasks = [
-            self._evaluate_exchange(exchange, zar_amount)
-            for exchange in self.clients.keys()
-        ]
-        
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        self.logger.info("Finding best conversion path for %.2f ZAR", zar_amount)
         
-        # Filter out None results and exceptions
-        valid_paths = [r for r in results if isinstance(r, ConversionPath)]
-        
-        if not valid_paths:
-            raise ValueError("No valid conversion paths found")
-        
-        # Sort by USDC received (descending)
-        valid_paths.sort(key=lambda x: x.usdc_received, reverse=True)
+        if len(self.clients) == 1:
+            # A single exchange needs no task fan-out or ranking
+            exchange = next(iter(self.clients))
+            best = await self._evaluate_exchange(exchange, zar_amount)
+            if best is None:
+                raise ValueError("No valid conversion paths found")
+            alternatives: tuple[ConversionPath, ...] = ()
+        else:
+            # Evaluate all exchanges concurrently
+            tasks = [
+                self._evaluate_exchange(exchange, zar_amount)
+                for exchange in self.clients.keys()
+            ]
+            
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            
+            # Filter out None results and exceptions
+            valid_paths = [r for r in results if isinstance(r, ConversionPath)]
+            
+            if not valid_paths:
+                raise ValueError("No valid conversion paths found")
+            
+            # Pick the path with the most USDC received; only the
+            # alternatives need ordering (descending) for display
+            key = attrgetter("usdc_received")
+            best = max(valid_paths, key=key)
+            alternatives = tuple(sorted(
+                (p for p in valid_paths if p is not best), key=key, reverse=True
+            ))
         
         # Create result
         result = ConversionResult(
-            optimal_path=valid_paths[0],
-            alternative_paths=valid_paths[1:],
-            timestamp=datetime.now(timezone.utc).timestamp()
+            optimal_path=best,
+            alternative_paths=alternatives,
+            timestamp=time.time()
         )
         
         self.logger.info(
-            f"Best exchange: {result.optimal_path.exchange.value} "
-            f"(Rate: {result.optimal_path.rate:.4f}, "
-            f"USDC: {result.optimal_path.usdc_received:.2f})"
+            "Best exchange: %s (Rate: %.4f, USDC: %.2f)",
+            EXCHANGE_NAMES[result.optimal_path.exchange],
+            result.optimal_path.rate,
+            result.optimal_path.usdc_received
         )
         
         return result
 
 
 # Helper function for synchronous interface
-async def find_best_path(zar_amount: float, clients: Dict[Exchange, ExchangeClientBase] = None) -> ConversionResult:
+async def find_best_path(zar_amount: float, clients: Optional[Dict[Exchange, ExchangeClientBase]] = None) -> ConversionResult:
     """
     Find the best conversion path from ZAR to USDC.
     
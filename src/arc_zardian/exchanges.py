@@ -0,0 +1,46 @@
+"""Shared ccxt exchange access for Arc ZARDIAN.
+
+ccxt registers every exchange it supports when imported, so the import is
+deferred until an exchange is actually needed.
+"""
+
+import importlib
+from functools import lru_cache
+from typing import Any
+
+
+@lru_cache(maxsize=None)
+def get_exchange_class(name: str, asynchronous: bool = False) -> Any:
+    """Return the ccxt exchange class called ``name``.
+
+    Args:
+        name: ccxt exchange id, e.g. ``"binance"``.
+        asynchronous: Return the ``ccxt.async_support`` variant of the class.
+
+    Returns:
+        The exchange class.
+    """
+    module = "ccxt.async_support" if asynchronous else "ccxt"
+    return getattr(importlib.import_module(module), name)
+
+
+@lru_cache(maxsize=None)
+def get_exchange(name: str, api_key: str, secret: str) -> Any:
+    """Return a shared, rate-limited ccxt client for ``name``.
+
+    Clients are cached per credentials, so repeated lookups reuse the same
+    HTTP session and loaded markets instead of building a new client.
+
+    Args:
+        name: ccxt exchange id, e.g. ``"binance"``.
+        api_key: API key for the exchange.
+        secret: API secret for the exchange.
+
+    Returns:
+        The exchange client.
+    """
+    return get_exchange_class(name)({
+        'apiKey': api_key,
+        'secret': secret,
+        'enableRateLimit': True
+    })
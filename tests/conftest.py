@@ -0,0 +1,60 @@
+"""Shared pytest configuration for the Arc ZARDIAN test suite."""
+
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Make the package importable from a source checkout, once for the session
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from arc_zardian.core.models import Exchange, ConversionPath, ConversionResult
+
+
+def _network_blocked(*args, **kwargs):
+    raise RuntimeError("Tests must not make network requests")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _no_network():
+    """Fail fast on any HTTP request made through aiohttp or requests.
+
+    ccxt's async clients open ``aiohttp.ClientSession`` objects and its sync
+    clients go through ``requests.Session``, so blocking both keeps a stray
+    exchange call from reaching the network.
+    """
+    with patch("aiohttp.ClientSession", side_effect=_network_blocked), \
+         patch("requests.Session.request", side_effect=_network_blocked):
+        yield
+
+
+@pytest.fixture(scope="session")
+def test_result():
+    """A conversion result built once and shared by every test in the session."""
+    return ConversionResult(
+        optimal_path=ConversionPath(
+            exchange=Exchange.BINANCE,
+            zar_amount=1000.0,
+            usdc_received=52.50,
+            fee=10.0,
+            rate=18.50
+        ),
+        alternative_paths=(
+            ConversionPath(
+                exchange=Exchange.LUNO,
+                zar_amount=1000.0,
+                usdc_received=51.20,
+                fee=12.0,
+                rate=19.20
+            ),
+            ConversionPath(
+                exchange=Exchange.BYBIT,
+                zar_amount=1000.0,
+                usdc_received=50.80,
+                fee=8.0,
+                rate=19.50
+            ),
+        ),
+        timestamp=0.0
+    )
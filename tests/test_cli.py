@@ -0,0 +1,49 @@
+import asyncio
+import logging
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from arc_zardian.cli import _check_status
+from arc_zardian.config import Settings
+
+SETTINGS = Settings(
+    BINANCE_API_KEY="binance_key",
+    BINANCE_API_SECRET="binance_secret",
+    LUNO_API_KEY="luno_key",
+    LUNO_API_SECRET="luno_secret",
+    BYBIT_API_KEY="bybit_key",
+    BYBIT_API_SECRET="bybit_secret",
+)
+
+@pytest.fixture
+def exchanges():
+    """Stub the async ccxt clients, one per exchange id."""
+    clients = {
+        "binance": AsyncMock(**{"fetch_balance.return_value": {"ZAR": {"free": 100.0}}}),
+        "luno": AsyncMock(**{"fetch_balance.side_effect": asyncio.CancelledError()}),
+        "bybit": AsyncMock(**{"fetch_balance.side_effect": Exception("API error")}),
+    }
+
+    def _exchange_class(name, asynchronous=False):
+        assert asynchronous
+        return MagicMock(return_value=clients[name])
+
+    with patch('arc_zardian.cli.get_exchange_class', side_effect=_exchange_class), \
+         patch('arc_zardian.cli.get_settings', return_value=SETTINGS):
+        yield clients
+
+async def test_check_status(exchanges, caplog):
+    """Test that every exchange is queried and failures are reported per exchange."""
+    with caplog.at_level(logging.INFO, logger="arc_zardian.cli"):
+        await _check_status()
+
+    # Every client was queried once and closed, whether or not it failed
+    for client in exchanges.values():
+        client.fetch_balance.assert_awaited_once()
+        client.close.assert_awaited_once()
+
+    assert "Binance connection successful" in caplog.text
+    assert "Available ZAR: 100.00" in caplog.text
+    assert "LUNO connection failed" in caplog.text
+    assert "Bybit connection failed: API error" in caplog.text
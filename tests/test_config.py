@@ -1,9 +1,10 @@
 """Tests for the configuration module."""
 
 import os
+import tempfile
 from unittest import TestCase, mock
 
-from arc_zardian.config import Settings, get_settings, init_settings
+from arc_zardian.config import Settings, _parse_dotenv, get_settings
 
 
 class TestConfig(TestCase):
@@ -36,7 +37,8 @@ class TestConfig(TestCase):
             """)
         
         try:
-            settings = Settings()
+            settings = Settings.from_env()
+            self.assertEqual(settings.BINANCE_API_KEY, "test_binance_key")
             self.assertEqual(settings.ENVIRONMENT, "development")
             self.assertEqual(settings.LOG_LEVEL, "INFO")
             self.assertEqual(settings.DEFAULT_FIAT_CURRENCY, "ZAR")
@@ -48,19 +50,36 @@ class TestConfig(TestCase):
             if os.path.exists(".env"):
                 os.remove(".env")
 
+    def test_dotenv_changes_are_picked_up(self) -> None:
+        """Test that an edited .env file is re-read despite caching."""
+        with tempfile.TemporaryDirectory() as tmpdir, \
+             mock.patch.dict(os.environ):
+            os.environ.pop("LOG_LEVEL", None)
+            env_file = os.path.join(tmpdir, ".env")
+
+            with open(env_file, "w") as f:
+                f.write("LOG_LEVEL=DEBUG\n")
+            self.assertEqual(Settings.from_env(env_file).LOG_LEVEL, "DEBUG")
+
+            with open(env_file, "w") as f:
+                f.write("LOG_LEVEL=WARNING  # quieter\n")
+            self.assertEqual(Settings.from_env(env_file).LOG_LEVEL, "WARNING")
+
+    def test_invalid_value_names_the_setting(self) -> None:
+        """Test that a value of the wrong type reports which setting is bad."""
+        with mock.patch.dict(os.environ, {"RATE_LIMIT": "abc"}):
+            with self.assertRaisesRegex(ValueError, "^RATE_LIMIT: "):
+                Settings.from_env(os.devnull)
+
     def test_required_fields(self) -> None:
         """Test that required fields are properly set."""
         # The required fields should be set from the environment variables in setUp
         settings = Settings(
             BINANCE_API_KEY="test_binance_key",
             BINANCE_API_SECRET="test_binance_secret",
-            VALR_API_KEY="test_valr_key",
-            VALR_API_SECRET="test_valr_secret"
         )
         self.assertEqual(settings.BINANCE_API_KEY, "test_binance_key")
         self.assertEqual(settings.BINANCE_API_SECRET, "test_binance_secret")
-        self.assertEqual(settings.VALR_API_KEY, "test_valr_key")
-        self.assertEqual(settings.VALR_API_SECRET, "test_valr_secret")
 
     def test_min_profit_validation(self) -> None:
         """Test that minimum profit validation works."""
@@ -68,23 +87,84 @@ class TestConfig(TestCase):
             Settings(
                 BINANCE_API_KEY="test",
                 BINANCE_API_SECRET="test",
-                VALR_API_KEY="test",
-                VALR_API_SECRET="test",
                 MIN_PROFIT_PERCENTAGE=-1
             )
 
     def test_get_settings_singleton(self) -> None:
         """Test that get_settings returns a singleton instance."""
-        # Reset the global settings for this test
-        from arc_zardian.config import settings as global_settings
-        global global_settings
-        original_settings = global_settings
-        global_settings = None
-        
+        get_settings.cache_clear()
         try:
             settings1 = get_settings()
             settings2 = get_settings()
             self.assertIs(settings1, settings2)
         finally:
-            # Restore the original settings
-            global_settings = original_settings
+            get_settings.cache_clear()
+
+    def test_module_settings_attribute(self) -> None:
+        """Test that config.settings resolves to the cached instance."""
+        from arc_zardian import config
+
+        get_settings.cache_clear()
+        try:
+            self.assertIs(config.settings, get_settings())
+        finally:
+            get_settings.cache_clear()
+
+
+class TestParseDotenv(TestCase):
+    """Test the dotenv file parser."""
+
+    def setUp(self) -> None:
+        """Create a scratch directory for the dotenv files."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+
+    def _parse(self, text: str) -> dict:
+        """Write ``text`` to a fresh dotenv file and parse it."""
+        path = os.path.join(self.tmpdir.name, f"{self.id()}.env")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        return _parse_dotenv(path)
+
+    def test_quoted_values(self) -> None:
+        """Test that quotes are stripped, including before a trailing comment."""
+        values = self._parse(
+            'DOUBLE="secret"\n'
+            "SINGLE='secret'\n"
+            'COMMENTED="secret"  # prod\n'
+            'HASH="se#cret"\n'
+        )
+        self.assertEqual(values["DOUBLE"], "secret")
+        self.assertEqual(values["SINGLE"], "secret")
+        self.assertEqual(values["COMMENTED"], "secret")
+        self.assertEqual(values["HASH"], "se#cret")
+
+    def test_export_prefix(self) -> None:
+        """Test that an ``export`` prefix is ignored."""
+        self.assertEqual(self._parse("export KEY=value\n"), {"KEY": "value"})
+
+    def test_comments(self) -> None:
+        """Test that comment lines and trailing comments are dropped."""
+        values = self._parse(
+            "# a comment\n"
+            "KEY=value  # note\n"
+            "HASH=se#cret\n"
+            "LEADING_HASH=#secret\n"
+        )
+        self.assertEqual(
+            values, {"KEY": "value", "HASH": "se#cret", "LEADING_HASH": "#secret"}
+        )
+
+    def test_blank_values(self) -> None:
+        """Test that blank lines are skipped and empty values kept."""
+        values = self._parse(
+            "\n"
+            "EMPTY=\n"
+            'QUOTED=""\n'
+            "COMMENT_ONLY=  # note\n"
+        )
+        self.assertEqual(values, {"EMPTY": "", "QUOTED": "", "COMMENT_ONLY": ""})
+
+    def test_missing_file(self) -> None:
+        """Test that a missing file yields no values."""
+        self.assertEqual(_parse_dotenv(os.path.join(self.tmpdir.name, "missing")), {})
@@ -0,0 +1 @@
+# Test package for the Streamlit presentation layer